@@ -1,9 +1,9 @@
+import numba as nb
 import numpy as np
 import math
-import statistics
-import pydantic
 import time
-from typing import Optional, Literal, List, Dict
+from dataclasses import dataclass
+from typing import Literal, List, Dict, get_args
 
 
 TaskDescription = Literal[
@@ -16,8 +16,27 @@ TaskDescription = Literal[
     "Persuasion",
 ]
 
+# fixed ordering of tasks used for the capability arrays in the simulation loop
+TASK_DESCRIPTIONS = get_args(TaskDescription)
+TASK_INDEX = {desc: i for i, desc in enumerate(TASK_DESCRIPTIONS)}
+# plain ints so they can be used as constants inside numba-compiled functions
+TASK_INDEX_RESEARCH = TASK_INDEX["Scientific research"]
+TASK_INDEX_SOFTWARE_ENG = TASK_INDEX["Software engineering"]
+TASK_INDEX_HARDWARE_ENG = TASK_INDEX["Hardware engineering"]
+
+# How many simluations to run
+N_SIMS = 1000
+
+# simulations that haven't passed an endpoint condition after this many days are given up on (censored).
+# this is far beyond the slowest normal takeoffs (a few hundred years) so it only catches pathological samples
+MAX_DAYS = 365 * 10_000
+
+# default source of randomness, pass a seeded generator to main() for reproducible runs
+RNG = np.random.default_rng()
+
 # made up parameters = numbers I made up based on my rough beliefs, can adjust based on your own beliefs and see how takeoff distribution changes
-class MadeUpParameters(pydantic.BaseModel):
+@dataclass(frozen=True)
+class MadeUpParameters:
     # default years to cross human range means: how long, without AI automation, would it take for AIs to go from 0th to 100th percentile human capability at a typical task?
     # In favor of shorter years to cross human range: many challenging NLP benchmarks have moved through human range very quickly recently (<< 4 years)
     # In favor of longer years to cross human range: some previous AI Impacts investigations found significantly longer time cross human range (often >>4 years).
@@ -27,9 +46,6 @@ class MadeUpParameters(pydantic.BaseModel):
     default_years_to_cross_human_range_lognormal_mean: float = 1.5
     default_years_to_cross_human_range_lognormal_stdev: float = 1
 
-    # how many years does it take to cross the human range, by default across tasks? calculated in __init__ from above
-    default_years_to_cross_human_range: float = 4.5
-
     # how much correlation is there between how much time it takes to cross the human range across various tasks?
     # 0 = perfectly correlated, larger numbers mean higher stdev when generating this parameter for each task
     default_years_to_cross_human_range_stdev_across_tasks: float = 0.3
@@ -41,59 +57,6 @@ class MadeUpParameters(pydantic.BaseModel):
     # NOTE THAT ONLY DAY IS IMPLEMENTED FOR NOW, CHANGING THIS DOES NOTHING
     iteration_speed: str = "DAY"
 
-    # See https://docs.google.com/spreadsheets/d/1u6SsZcnAjahh7wsh0cbldVaXSHXbFLarBeu7t4jyf7E/edit#gid=0 for context
-    takeoff_startpoint_conditions: List[Dict[TaskDescription, float]] = [
-        {"Scientific research": 1.1, "Software engineering": 0.99, "Strategy": 0.95},
-        {"Persuasion": 1},
-        {"Hacking": 1.1},
-        {"Strategy": 1},
-        {
-            "Scientific research": 1,
-            "Software engineering": 1,
-            "Hardware engineering": 1,
-        },
-        {"Physical engineering": 1},
-    ]
-    automating_alignment_startpoint_conditions: List[Dict[TaskDescription, float]] = [
-        {"Scientific research": 1.05, "Software engineering": 0.99, "Strategy": 0.95},
-    ]
-    public_awareness_startpoint_conditions: List[Dict[TaskDescription, float]] = [
-        {"Hacking": 1.1},
-        {"Strategy": 1},
-    ]
-    economic_transformation_startpoint_conditions: List[
-        Dict[TaskDescription, float]
-    ] = [
-        {"Strategy": 1},
-        {
-            "Scientific research": 1,
-            "Software engineering": 1,
-            "Hardware engineering": 1,
-        },
-        {"Physical engineering": 1},
-    ]
-    takeoff_endpoint_conditions: List[Dict[TaskDescription, float]] = [
-        {"Physical engineering": 3, "Strategy": 1.5},
-        {"Strategy": 2, "Persuasion": 2},
-        {"Strategy": 2, "Hacking": 2},
-        {
-            "Scientific research": 1.5,
-            "Software engineering": 1.5,
-            "Hardware engineering": 1.5,
-            "Physical engineering": 1.5,
-            "Strategy": 1.7,
-            "Hacking": 1.5,
-            "Persuasion": 1.7,
-        },
-        {
-            "Scientific research": 2,
-            "Software engineering": 2,
-            "Hardware engineering": 2,
-            "Physical engineering": 2,
-            "Strategy": 2,
-        },
-    ]
-
     # parameter for how steep the marginal returns are
     # to increased intelligence near the human range
     # the higher the exponent, the steeper the translation
@@ -105,117 +68,164 @@ class MadeUpParameters(pydantic.BaseModel):
     # median of the distribution is 4.5, 10th percentile is 1.6, 90th percentile is 12
     marginal_returns_to_intelligence_exponent_lognormal_mean: float = 1.5
     marginal_returns_to_intelligence_exponent_lognormal_stdev: float = 0.8
-    marginal_returns_to_intelligence_exponent: float = 4.5
-
-    # How many simluations to run
-    N_SIMS = 1000
-
-    def __init__(
-        self,
-        default_years_to_cross_human_range_lognormal_mean=1.5,
-        default_years_to_cross_human_range_lognormal_stdev=1,
-        marginal_returns_to_intelligence_exponent_lognormal_mean=1.5,
-        marginal_returns_to_intelligence_exponent_lognormal_stdev=0.8,
-        **data,
-    ):
-        default_years_to_cross_human_range = np.random.lognormal(
-            default_years_to_cross_human_range_lognormal_mean,
-            default_years_to_cross_human_range_lognormal_stdev,
+
+    # samples the per-simulation parameters for n_sims simulations at once from the distributions above:
+    # how many years does it take to cross the human range, by default across tasks?
+    # and the marginal returns to intelligence exponent
+    def sample(self, n_sims: int, rng: np.random.Generator = RNG):
+        default_years_to_cross_human_range = rng.lognormal(
+            self.default_years_to_cross_human_range_lognormal_mean,
+            self.default_years_to_cross_human_range_lognormal_stdev,
+            n_sims,
         )
-        marginal_returns_to_intelligence_exponent = np.random.lognormal(
-            marginal_returns_to_intelligence_exponent_lognormal_mean,
-            marginal_returns_to_intelligence_exponent_lognormal_stdev,
+        marginal_returns_to_intelligence_exponent = rng.lognormal(
+            self.marginal_returns_to_intelligence_exponent_lognormal_mean,
+            self.marginal_returns_to_intelligence_exponent_lognormal_stdev,
+            n_sims,
         )
-        super().__init__(
-            default_years_to_cross_human_range=default_years_to_cross_human_range,
-            default_years_to_cross_human_range_lognormal_mean=default_years_to_cross_human_range_lognormal_mean,
-            default_years_to_cross_human_range_lognormal_stdev=default_years_to_cross_human_range_lognormal_stdev,
-            marginal_returns_to_intelligence_exponent=marginal_returns_to_intelligence_exponent,
-            marginal_returns_to_intelligence_exponent_lognormal_mean=marginal_returns_to_intelligence_exponent_lognormal_mean,
-            marginal_returns_to_intelligence_exponent_lognormal_stdev=marginal_returns_to_intelligence_exponent_lognormal_stdev,
-            **data,
+        return (
+            default_years_to_cross_human_range,
+            marginal_returns_to_intelligence_exponent,
         )
 
 
-class Task(pydantic.BaseModel):
-    description: TaskDescription
-    capability: float = 0  # 0 = 0th percentile human, 1 = 100th percentile human, outside 0-1 = roughly extrapolating from this
-    made_up_parameters: MadeUpParameters
-    years_to_cross_human_range: Optional[
-        float
-    ] = None  # With no AI automation, how long would it take to cross human range for this task? calculated in init
-
-    def __init__(
-        self,
-        made_up_parameters: MadeUpParameters,
-        capability: Optional[float] = None,
-        **data,
-    ):
-        super().__init__(
-            made_up_parameters=made_up_parameters,
-            capability=np.random.normal(
-                0, made_up_parameters.starting_capability_stdev
-            ),
-            years_to_cross_human_range=max(
-                np.random.normal(
-                    made_up_parameters.default_years_to_cross_human_range,
-                    made_up_parameters.default_years_to_cross_human_range_stdev_across_tasks,
-                ),
-                0.0001,
-            ),
-            **data,
-        )
-
-    @property
-    def default_progress_in_a_day(self):
-        return 1 / (self.years_to_cross_human_range * 365)
+# conditions are made up parameters too, but are the same across every simulation
+# See https://docs.google.com/spreadsheets/d/1u6SsZcnAjahh7wsh0cbldVaXSHXbFLarBeu7t4jyf7E/edit#gid=0 for context
+TAKEOFF_STARTPOINT_CONDITIONS: List[Dict[TaskDescription, float]] = [
+    {"Scientific research": 1.1, "Software engineering": 0.99, "Strategy": 0.95},
+    {"Persuasion": 1},
+    {"Hacking": 1.1},
+    {"Strategy": 1},
+    {
+        "Scientific research": 1,
+        "Software engineering": 1,
+        "Hardware engineering": 1,
+    },
+    {"Physical engineering": 1},
+]
+AUTOMATING_ALIGNMENT_STARTPOINT_CONDITIONS: List[Dict[TaskDescription, float]] = [
+    {"Scientific research": 1.05, "Software engineering": 0.99, "Strategy": 0.95},
+]
+PUBLIC_AWARENESS_STARTPOINT_CONDITIONS: List[Dict[TaskDescription, float]] = [
+    {"Hacking": 1.1},
+    {"Strategy": 1},
+]
+ECONOMIC_TRANSFORMATION_STARTPOINT_CONDITIONS: List[Dict[TaskDescription, float]] = [
+    {"Strategy": 1},
+    {
+        "Scientific research": 1,
+        "Software engineering": 1,
+        "Hardware engineering": 1,
+    },
+    {"Physical engineering": 1},
+]
+TAKEOFF_ENDPOINT_CONDITIONS: List[Dict[TaskDescription, float]] = [
+    {"Physical engineering": 3, "Strategy": 1.5},
+    {"Strategy": 2, "Persuasion": 2},
+    {"Strategy": 2, "Hacking": 2},
+    {
+        "Scientific research": 1.5,
+        "Software engineering": 1.5,
+        "Hardware engineering": 1.5,
+        "Physical engineering": 1.5,
+        "Strategy": 1.7,
+        "Hacking": 1.5,
+        "Persuasion": 1.7,
+    },
+    {
+        "Scientific research": 2,
+        "Software engineering": 2,
+        "Hardware engineering": 2,
+        "Physical engineering": 2,
+        "Strategy": 2,
+    },
+]
 
 
-def generate_capabilities_starting_point(made_up_parameters):
+def generate_capabilities_starting_point(
+    made_up_parameters: MadeUpParameters,
+    default_years_to_cross_human_range: np.ndarray,
+    rng: np.random.Generator = RNG,
+):
     # Tasks come from Joe Carlsmith's report
     # https://docs.google.com/document/d/1smaI1lagHHcrhoi6ohdq3TYIZv0eNWWZMPEy8C8byYg/edit#heading=h.m8h4m2hdkr0u
     # with a few minor modifications
-    return [
-        Task(
-            description="Scientific research",
-            made_up_parameters=made_up_parameters,
-        ),
-        Task(
-            description="Software engineering",
-            made_up_parameters=made_up_parameters,
-        ),
-        Task(
-            description="Hardware engineering",
-            made_up_parameters=made_up_parameters,
-        ),
-        Task(
-            description="Physical engineering",
-            made_up_parameters=made_up_parameters,
+    # returns (n_sims, n_tasks) arrays of starting capabilities and default progress in a day,
+    # one row per simulation and columns in TASK_DESCRIPTIONS order.
+    # capability: 0 = 0th percentile human, 1 = 100th percentile human, outside 0-1 = roughly extrapolating from this
+    shape = (len(default_years_to_cross_human_range), len(TASK_DESCRIPTIONS))
+
+    capabilities = rng.normal(0, made_up_parameters.starting_capability_stdev, shape)
+    # With no AI automation, how long would it take to cross human range for each task?
+    years_to_cross_human_range = np.maximum(
+        rng.normal(
+            default_years_to_cross_human_range[:, None],
+            made_up_parameters.default_years_to_cross_human_range_stdev_across_tasks,
+            shape,
         ),
-        Task(
-            description="Strategy",
-            made_up_parameters=made_up_parameters,
-        ),
-        Task(
-            description="Hacking",
-            made_up_parameters=made_up_parameters,
-        ),
-        Task(
-            description="Persuasion",
-            made_up_parameters=made_up_parameters,
+        0.0001,
+    )
+    return capabilities, 1 / (years_to_cross_human_range * 365)
+
+
+# converts a list of condition dicts into flat arrays of clauses: condition i is made up of the
+# (task index, threshold) clauses between condition_offsets[i] and condition_offsets[i + 1].
+# clauses are sorted hardest first within each condition so checks can bail out early
+def conditions_to_arrays(conditions: List[Dict[TaskDescription, float]]):
+    clauses = [
+        sorted(condition.items(), key=lambda clause: -clause[1])
+        for condition in conditions
+    ]
+    clause_tasks = np.array(
+        [TASK_INDEX[desc] for condition in clauses for desc, _ in condition],
+        dtype=np.int64,
+    )
+    clause_thresholds = np.array(
+        [threshold for condition in clauses for _, threshold in condition],
+        dtype=np.float64,
+    )
+    condition_offsets = np.cumsum([0] + [len(condition) for condition in clauses])
+    return clause_tasks, clause_thresholds, condition_offsets
+
+
+# concatenates several condition lists, along with list_offsets such that list k is made up of
+# the conditions between list_offsets[k] and list_offsets[k + 1]
+def condition_lists_to_arrays(
+    condition_lists: List[List[Dict[TaskDescription, float]]],
+):
+    list_offsets = np.cumsum([0] + [len(conditions) for conditions in condition_lists])
+    return (
+        *conditions_to_arrays(
+            [condition for conditions in condition_lists for condition in conditions]
         ),
+        list_offsets,
+    )
+
+
+# the conditions never change so they are converted into arrays once, at import
+STARTPOINT_CONDITION_ARRAYS = condition_lists_to_arrays(
+    [
+        TAKEOFF_STARTPOINT_CONDITIONS,
+        AUTOMATING_ALIGNMENT_STARTPOINT_CONDITIONS,
+        PUBLIC_AWARENESS_STARTPOINT_CONDITIONS,
+        ECONOMIC_TRANSFORMATION_STARTPOINT_CONDITIONS,
     ]
+)
+ENDPOINT_CONDITION_ARRAYS = conditions_to_arrays(TAKEOFF_ENDPOINT_CONDITIONS)
 
 
 # a bit confusingly named, capabilities need to have only passed one of the conditions
+@nb.njit(cache=True, fastmath=True)
 def have_capabilities_passed_conditions(
-    task_list: List[Task], conditions: List[Dict[TaskDescription, float]]
+    capabilities: np.ndarray,
+    clause_tasks: np.ndarray,
+    clause_thresholds: np.ndarray,
+    condition_offsets: np.ndarray,
 ):
-    for condition in conditions:
+    for i in range(condition_offsets.shape[0] - 1):
         condition_met = True
-        for desc, threshold in condition.items():
-            task = [t for t in task_list if t.description == desc][0]
-            if task.capability < threshold:
+        for j in range(condition_offsets[i], condition_offsets[i + 1]):
+            if capabilities[clause_tasks[j]] < clause_thresholds[j]:
                 condition_met = False
                 break
         if condition_met:
@@ -223,208 +233,318 @@ def have_capabilities_passed_conditions(
     return False
 
 
-def capability_increase_step(
-    task_list: List[Task], made_up_parameters: MadeUpParameters
+# capability ** exponent written as exp(exponent * log(capability)), which is cheaper than a general pow.
+# capabilities below 0th percentile human contribute nothing, which also keeps log away from 0 and negatives
+@nb.njit(cache=True, fastmath=True)
+def returns_to_intelligence(
+    capability: float, marginal_returns_to_intelligence_exponent: float
 ):
-    research_capability = [
-        t for t in task_list if t.description == "Scientific research"
-    ][0].capability
-    software_eng_capability = [
-        t for t in task_list if t.description == "Software engineering"
-    ][0].capability
-    hardware_eng_capability = [
-        t for t in task_list if t.description == "Hardware engineering"
-    ][0].capability
-
-    increase_factor = 1
-
-    # hacky check to avoid issues with complex numbers
-    if min(research_capability, software_eng_capability, hardware_eng_capability) > 0:
-
-        # calculate separate speedup in capability improvement for software improvements vs. hardware improvements
-        software_multiplier = (
-            (
-                research_capability
-                ** made_up_parameters.marginal_returns_to_intelligence_exponent
-            )
-            + (
-                software_eng_capability
-                ** made_up_parameters.marginal_returns_to_intelligence_exponent
-            )
-        ) / 2
-        hardware_multiplier = (
-            (
-                research_capability
-                ** made_up_parameters.marginal_returns_to_intelligence_exponent
-            )
-            + (
-                hardware_eng_capability
-                ** made_up_parameters.marginal_returns_to_intelligence_exponent
-            )
-        ) / 2
-
-        increase_factor = max((software_multiplier + hardware_multiplier) / 2, 1)
-
-        # print(
-        #     research_capability,
-        #     software_eng_capability,
-        #     hardware_eng_capability,
-        #     software_multiplier,
-        #     hardware_multiplier,
-        #     increase_factor,
-        # )
-
-    for task in task_list:
-        task.capability = (
-            task.capability + task.default_progress_in_a_day * increase_factor
-        )
+    if capability <= 0.0:
+        return 0.0
+    return math.exp(marginal_returns_to_intelligence_exponent * math.log(capability))
 
 
-def main():
-    s = time.time()
+@nb.njit(cache=True, fastmath=True)
+def increase_factor(
+    research_capability: float,
+    software_eng_capability: float,
+    hardware_eng_capability: float,
+    marginal_returns_to_intelligence_exponent: float,
+):
+    # research feeds into both multipliers so only compute its returns once
+    research_returns = returns_to_intelligence(
+        research_capability, marginal_returns_to_intelligence_exponent
+    )
 
-    any_takeoff_years_taken = []
-    automating_alignment_takeoff_years_taken = []
-    public_awareness_takeoff_years_taken = []
-    economic_transformation_takeoff_years_taken = []
+    # calculate separate speedup in capability improvement for software improvements vs. hardware improvements
+    software_multiplier = (
+        research_returns
+        + returns_to_intelligence(
+            software_eng_capability, marginal_returns_to_intelligence_exponent
+        )
+    ) / 2
+    hardware_multiplier = (
+        research_returns
+        + returns_to_intelligence(
+            hardware_eng_capability, marginal_returns_to_intelligence_exponent
+        )
+    ) / 2
 
-    for _ in range(MadeUpParameters().N_SIMS):
-        made_up_parameters = MadeUpParameters()
-        # print(made_up_parameters)
+    return max((software_multiplier + hardware_multiplier) / 2, 1.0)
 
-        task_list = generate_capabilities_starting_point(made_up_parameters)
 
-        days = 0
-        any_takeoff_start_day = 0
-        automating_alignment_takeoff_start_day = 0
-        public_awareness_takeoff_start_day = 0
-        economic_transformation_takeoff_start_day = 0
+# how many days of progress it takes for a capability to reach a threshold
+@nb.njit(cache=True, fastmath=True)
+def days_to_reach(capability: float, progress_per_day: float, threshold: float):
+    if capability >= threshold:
+        return 0.0
+    return math.ceil((threshold - capability) / progress_per_day)
 
-        while True:
-            if any_takeoff_start_day == 0 and have_capabilities_passed_conditions(
-                task_list, made_up_parameters.takeoff_startpoint_conditions
-            ):
-                any_takeoff_start_day = days
-            if (
-                automating_alignment_takeoff_start_day == 0
-                and have_capabilities_passed_conditions(
-                    task_list,
-                    made_up_parameters.automating_alignment_startpoint_conditions,
-                )
-            ):
-                automating_alignment_takeoff_start_day = days
-            if (
-                public_awareness_takeoff_start_day == 0
-                and have_capabilities_passed_conditions(
-                    task_list, made_up_parameters.public_awareness_startpoint_conditions
-                )
-            ):
-                public_awareness_takeoff_start_day = days
-            if (
-                economic_transformation_takeoff_start_day == 0
-                and have_capabilities_passed_conditions(
-                    task_list,
-                    made_up_parameters.economic_transformation_startpoint_conditions,
-                )
-            ):
-                economic_transformation_takeoff_start_day = days
-            if have_capabilities_passed_conditions(
-                task_list, made_up_parameters.takeoff_endpoint_conditions
+
+# lower bound on how many days it takes until any of the conditions could be passed
+@nb.njit(cache=True, fastmath=True)
+def days_to_pass_conditions(
+    capabilities: np.ndarray,
+    progress_per_day: np.ndarray,
+    clause_tasks: np.ndarray,
+    clause_thresholds: np.ndarray,
+    condition_offsets: np.ndarray,
+    max_days: float,
+):
+    for i in range(condition_offsets.shape[0] - 1):
+        condition_days = 0.0
+        for j in range(condition_offsets[i], condition_offsets[i + 1]):
+            task = clause_tasks[j]
+            condition_days = max(
+                condition_days,
+                days_to_reach(
+                    capabilities[task], progress_per_day[task], clause_thresholds[j]
+                ),
+            )
+        max_days = min(max_days, condition_days)
+    return max_days
+
+
+# while research, software and hardware capabilities are all below 1 the increase factor is stuck at 1,
+# so capabilities grow linearly and we can jump straight to the next day where something could happen.
+# returns how many days can safely be skipped this way (0 or less if none)
+@nb.njit(cache=True, fastmath=True)
+def linear_growth_days(
+    capabilities: np.ndarray,
+    progress_per_day: np.ndarray,
+    startpoint_days: np.ndarray,
+    startpoint_clause_tasks: np.ndarray,
+    startpoint_clause_thresholds: np.ndarray,
+    startpoint_condition_offsets: np.ndarray,
+    startpoint_list_offsets: np.ndarray,
+    endpoint_clause_tasks: np.ndarray,
+    endpoint_clause_thresholds: np.ndarray,
+    endpoint_condition_offsets: np.ndarray,
+):
+    skip = min(
+        days_to_reach(
+            capabilities[TASK_INDEX_RESEARCH],
+            progress_per_day[TASK_INDEX_RESEARCH],
+            1.0,
+        ),
+        days_to_reach(
+            capabilities[TASK_INDEX_SOFTWARE_ENG],
+            progress_per_day[TASK_INDEX_SOFTWARE_ENG],
+            1.0,
+        ),
+        days_to_reach(
+            capabilities[TASK_INDEX_HARDWARE_ENG],
+            progress_per_day[TASK_INDEX_HARDWARE_ENG],
+            1.0,
+        ),
+    )
+    for i in range(startpoint_days.shape[0]):
+        if startpoint_days[i] == 0:
+            skip = days_to_pass_conditions(
+                capabilities,
+                progress_per_day,
+                startpoint_clause_tasks,
+                startpoint_clause_thresholds,
+                startpoint_condition_offsets[
+                    startpoint_list_offsets[i] : startpoint_list_offsets[i + 1] + 1
+                ],
+                skip,
+            )
+    skip = days_to_pass_conditions(
+        capabilities,
+        progress_per_day,
+        endpoint_clause_tasks,
+        endpoint_clause_thresholds,
+        endpoint_condition_offsets,
+        skip,
+    )
+    # leave a day of slack in case of rounding error in the division above
+    return int(skip) - 1
+
+
+# runs a single simulation until one of the endpoint conditions is passed, updating capabilities in place.
+# the day each set of startpoint conditions was first passed is written into startpoint_days (left 0 if never),
+# returns the last day, or -1 if no endpoint condition was passed within max_days
+@nb.njit(cache=True, fastmath=True)
+def run_one_sim(
+    capabilities: np.ndarray,
+    progress_per_day: np.ndarray,
+    marginal_returns_to_intelligence_exponent: float,
+    startpoint_days: np.ndarray,
+    startpoint_clause_tasks: np.ndarray,
+    startpoint_clause_thresholds: np.ndarray,
+    startpoint_condition_offsets: np.ndarray,
+    startpoint_list_offsets: np.ndarray,
+    endpoint_clause_tasks: np.ndarray,
+    endpoint_clause_thresholds: np.ndarray,
+    endpoint_condition_offsets: np.ndarray,
+    max_days: int,
+):
+    days = 0
+
+    while days < max_days:
+        for i in range(startpoint_days.shape[0]):
+            if startpoint_days[i] == 0 and have_capabilities_passed_conditions(
+                capabilities,
+                startpoint_clause_tasks,
+                startpoint_clause_thresholds,
+                startpoint_condition_offsets[
+                    startpoint_list_offsets[i] : startpoint_list_offsets[i + 1] + 1
+                ],
             ):
-                break
-            capability_increase_step(task_list, made_up_parameters)
-            days += 1
+                startpoint_days[i] = days
+        if have_capabilities_passed_conditions(
+            capabilities,
+            endpoint_clause_tasks,
+            endpoint_clause_thresholds,
+            endpoint_condition_offsets,
+        ):
+            return days
+
+        # read once and shared by the linear growth check and the increase factor
+        research_capability = capabilities[TASK_INDEX_RESEARCH]
+        software_eng_capability = capabilities[TASK_INDEX_SOFTWARE_ENG]
+        hardware_eng_capability = capabilities[TASK_INDEX_HARDWARE_ENG]
+
+        skip = 0
+        if (
+            max(research_capability, software_eng_capability, hardware_eng_capability)
+            < 1.0
+        ):
+            skip = linear_growth_days(
+                capabilities,
+                progress_per_day,
+                startpoint_days,
+                startpoint_clause_tasks,
+                startpoint_clause_thresholds,
+                startpoint_condition_offsets,
+                startpoint_list_offsets,
+                endpoint_clause_tasks,
+                endpoint_clause_thresholds,
+                endpoint_condition_offsets,
+            )
+        skip = min(skip, max_days - days)
+        if skip > 0:
+            # the increase factor is 1 on every skipped day
+            step_days = skip
+            step_factor = float(skip)
+        else:
+            step_days = 1
+            step_factor = increase_factor(
+                research_capability,
+                software_eng_capability,
+                hardware_eng_capability,
+                marginal_returns_to_intelligence_exponent,
+            )
 
-        any_takeoff_days = (
-            0 if any_takeoff_start_day == 0 else days - any_takeoff_start_day
-        )
-        any_takeoff_years_taken.append(any_takeoff_days / 365)
-        automating_alignment_takeoff_days = (
-            0
-            if automating_alignment_takeoff_start_day == 0
-            else days - automating_alignment_takeoff_start_day
-        )
-        automating_alignment_takeoff_years_taken.append(
-            automating_alignment_takeoff_days / 365
-        )
-        public_awareness_takeoff_days = (
-            0
-            if public_awareness_takeoff_start_day == 0
-            else days - public_awareness_takeoff_start_day
-        )
-        public_awareness_takeoff_years_taken.append(public_awareness_takeoff_days / 365)
-        economic_transformation_takeoff_days = (
-            0
-            if economic_transformation_takeoff_start_day == 0
-            else days - economic_transformation_takeoff_start_day
-        )
-        economic_transformation_takeoff_years_taken.append(
-            economic_transformation_takeoff_days / 365
+        for i in range(capabilities.shape[0]):
+            capabilities[i] += progress_per_day[i] * step_factor
+        days += step_days
+
+    return -1
+
+
+# runs every simulation in one compiled call; each row of capabilities / progress_per_day is one simulation.
+# simulations are independent so they are spread across cores, and each one writes straight into its row of the
+# preallocated results so nothing is allocated per simulation
+@nb.njit(cache=True, fastmath=True, parallel=True)
+def run_sims(
+    capabilities: np.ndarray,
+    progress_per_day: np.ndarray,
+    marginal_returns_to_intelligence_exponents: np.ndarray,
+    startpoint_clause_tasks: np.ndarray,
+    startpoint_clause_thresholds: np.ndarray,
+    startpoint_condition_offsets: np.ndarray,
+    startpoint_list_offsets: np.ndarray,
+    endpoint_clause_tasks: np.ndarray,
+    endpoint_clause_thresholds: np.ndarray,
+    endpoint_condition_offsets: np.ndarray,
+    max_days: int,
+):
+    n_sims = capabilities.shape[0]
+    startpoint_days = np.zeros(
+        (n_sims, startpoint_list_offsets.shape[0] - 1), dtype=np.int64
+    )
+    days = np.zeros(n_sims, dtype=np.int64)
+
+    for i in nb.prange(n_sims):
+        days[i] = run_one_sim(
+            capabilities[i],
+            progress_per_day[i],
+            marginal_returns_to_intelligence_exponents[i],
+            startpoint_days[i],
+            startpoint_clause_tasks,
+            startpoint_clause_thresholds,
+            startpoint_condition_offsets,
+            startpoint_list_offsets,
+            endpoint_clause_tasks,
+            endpoint_clause_thresholds,
+            endpoint_condition_offsets,
+            max_days,
         )
 
-    print(
-        f"Ran {made_up_parameters.N_SIMS} simluations in {round(time.time() - s, 2)} seconds\n"
-    )
+    return startpoint_days, days
 
-    print("Time from any startpoint to AI plausibly being able to disempower humanity:")
-    print(
-        f"Mean: {round(sum(any_takeoff_years_taken) / len(any_takeoff_years_taken), 2)} years"
-    )
-    print(f"Median: {round(statistics.median(any_takeoff_years_taken), 2)} years")
-    print(
-        f"10th percentile: {round(np.percentile(any_takeoff_years_taken, 10), 2)} years"
-    )
-    print(
-        f"90th percentile: {round(np.percentile(any_takeoff_years_taken, 90), 2)} years\n"
-    )
 
+# years_taken may contain NaN for censored simulations, which are left out
+def print_summary(startpoint_description: str, years_taken: np.ndarray):
+    p10, median, p90 = np.nanpercentile(years_taken, [10, 50, 90])
     print(
-        "Time from very large gains from AI-assisted alignment research speedup to AI plausibly being able to disempower humanity:"
-    )
-    print(
-        f"Mean: {round(sum(automating_alignment_takeoff_years_taken) / len(automating_alignment_takeoff_years_taken), 2)} years"
-    )
-    print(
-        f"Median: {round(statistics.median(automating_alignment_takeoff_years_taken), 2)} years"
-    )
-    print(
-        f"10th percentile: {round(np.percentile(automating_alignment_takeoff_years_taken, 10), 2)} years"
-    )
-    print(
-        f"90th percentile: {round(np.percentile(automating_alignment_takeoff_years_taken, 90), 2)} years\n"
+        f"\nTime from {startpoint_description} to AI plausibly being able to disempower humanity:"
     )
+    print(f"Mean: {round(np.nanmean(years_taken), 2)} years")
+    print(f"Median: {round(median, 2)} years")
+    print(f"10th percentile: {round(p10, 2)} years")
+    print(f"90th percentile: {round(p90, 2)} years")
 
-    print(
-        "Time from very high public awareness of AI to AI plausibly being able to disempower humanity:"
-    )
-    print(
-        f"Mean: {round(sum(public_awareness_takeoff_years_taken) / len(public_awareness_takeoff_years_taken), 2)} years"
-    )
-    print(
-        f"Median: {round(statistics.median(public_awareness_takeoff_years_taken), 2)} years"
-    )
-    print(
-        f"10th percentile: {round(np.percentile(public_awareness_takeoff_years_taken, 10), 2)} years"
-    )
-    print(
-        f"90th percentile: {round(np.percentile(public_awareness_takeoff_years_taken, 90), 2)} years\n"
-    )
 
-    print(
-        "Time from potential economic transformation (not taking into account deployment lags or regulations) to AI plausibly being able to disempower humanity:"
-    )
-    print(
-        f"Mean: {round(sum(economic_transformation_takeoff_years_taken) / len(economic_transformation_takeoff_years_taken), 2)} years"
-    )
-    print(
-        f"Median: {round(statistics.median(economic_transformation_takeoff_years_taken), 2)} years"
+def main(rng: np.random.Generator = RNG):
+    s = time.time()
+
+    n_sims = N_SIMS
+
+    made_up_parameters = MadeUpParameters()
+    (
+        default_years_to_cross_human_range,
+        marginal_returns_to_intelligence_exponents,
+    ) = made_up_parameters.sample(n_sims, rng)
+    capabilities, progress_per_day = generate_capabilities_starting_point(
+        made_up_parameters, default_years_to_cross_human_range, rng
     )
-    print(
-        f"10th percentile: {round(np.percentile(economic_transformation_takeoff_years_taken, 10), 2)} years"
+
+    startpoint_days, days = run_sims(
+        capabilities,
+        progress_per_day,
+        marginal_returns_to_intelligence_exponents,
+        *STARTPOINT_CONDITION_ARRAYS,
+        *ENDPOINT_CONDITION_ARRAYS,
+        MAX_DAYS,
     )
-    print(
-        f"90th percentile: {round(np.percentile(economic_transformation_takeoff_years_taken, 90), 2)} years"
+
+    # a startpoint day of 0 means the startpoint was never (or only trivially) passed,
+    # censored simulations are NaN and left out of the summary statistics
+    censored = days < 0
+    takeoff_years_taken = np.where(
+        censored[:, None],
+        np.nan,
+        np.where(startpoint_days == 0, 0, days[:, None] - startpoint_days) / 365,
     )
+    print(f"Ran {n_sims} simluations in {round(time.time() - s, 2)} seconds")
+    if censored.any():
+        print(
+            f"\n{censored.sum()} simulations hadn't reached an endpoint after {MAX_DAYS // 365} years and are left out"
+        )
+
+    for startpoint_description, years_taken in zip(
+        [
+            "any startpoint",
+            "very large gains from AI-assisted alignment research speedup",
+            "very high public awareness of AI",
+            "potential economic transformation (not taking into account deployment lags or regulations)",
+        ],
+        takeoff_years_taken.T,
+    ):
+        print_summary(startpoint_description, years_taken)
 
 
 if __name__ == "__main__":